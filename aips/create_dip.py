@@ -28,6 +28,9 @@ import metsrw
 THIS_DIR = os.path.abspath(os.path.dirname(__file__))
 LOGGER = logging.getLogger("dip_workflow")
 
+# Accepted premis:originalName prefixes for original files
+ORIGINAL_NAME_PREFIXES = ("%transferDirectory%objects/", "%transferDirectory%data/")
+
 
 def setup_logger(log_file, log_level="INFO"):
     """Configures the logger to output to console and log file"""
@@ -152,21 +155,23 @@ def extract_aip(aip_file, aip_uuid, tmp_dir):
         pass
 
     # Find extracted entry. Assuming it contains the AIP UUID
-    extracted_entry = ""
-    for entry in os.listdir(tmp_dir):
-        if aip_uuid in entry:
-            extracted_entry = os.path.join(tmp_dir, entry)
+    extracted_entry = None
+    with os.scandir(tmp_dir) as entries:
+        for entry in entries:
+            if aip_uuid in entry.name:
+                extracted_entry = entry
 
-    if not extracted_entry:
+    if extracted_entry is None:
         LOGGER.error("Can not find extracted AIP by UUID")
         return
 
-    # Return folder path if it's a directory
-    if os.path.isdir(extracted_entry):
-        return extracted_entry
+    # Return folder path if it's a directory, the scandir entry already
+    # knows its type so this does not need another stat call
+    if extracted_entry.is_dir():
+        return extracted_entry.path
 
     # Re-try extraction if it's not a directory
-    return extract_aip(extracted_entry, aip_uuid, tmp_dir)
+    return extract_aip(extracted_entry.path, aip_uuid, tmp_dir)
 
 
 def create_dip(aip_dir, aip_uuid, output_dir, mets_type, dip_type):
@@ -212,12 +217,16 @@ def create_dip(aip_dir, aip_uuid, output_dir, mets_type, dip_type):
     namespaces = metsrw.utils.NAMESPACES.copy()
     premis_map = metsrw.plugins.premisrw.utils.PREMIS_VERSIONS_MAP
     fsentries = mets.all_files()
+    aip_data_dir = os.path.join(aip_dir, "data")
+    # Parent folders already created in the DIP, to avoid checking them again
+    # for every file they contain
+    created_dirs = {to_zip_dir}
     for fsentry in fsentries:
         if fsentry.use != "original" or not fsentry.path or not fsentry.file_uuid:
             continue
 
         LOGGER.info("Moving file: %s", fsentry.path)
-        aip_file_path = os.path.join(os.path.join(aip_dir, "data"), fsentry.path)
+        aip_file_path = os.path.join(aip_data_dir, fsentry.path)
         if not os.path.exists(aip_file_path):
             LOGGER.warning("Could not find file in AIP")
             continue
@@ -227,6 +236,7 @@ def create_dip(aip_dir, aip_uuid, output_dir, mets_type, dip_type):
             continue
 
         amdsec = fsentry.amdsecs[0]
+        techmd = None
         for item in amdsec.subsections:
             if item.subsection == "techMD":
                 techmd = item
@@ -253,8 +263,9 @@ def create_dip(aip_dir, aip_uuid, output_dir, mets_type, dip_type):
         # Move original file with original file name and create parent folders
         dip_file_path = os.path.join(to_zip_dir, original_relpath)
         dip_dir_path = os.path.dirname(dip_file_path)
-        if not os.path.exists(dip_dir_path):
-            os.makedirs(dip_dir_path)
+        if dip_dir_path not in created_dirs:
+            os.makedirs(dip_dir_path, exist_ok=True)
+            created_dirs.add(dip_dir_path)
 
         shutil.move(aip_file_path, dip_file_path)
 
@@ -287,16 +298,16 @@ def create_dip_mets(aip_dir, aip_name, fsentries, mets, dip_mets_file):
 
     LOGGER.info("Creating DIP METS file for AtoM/default upload.")
     objects_entry = None
+    aip_dir_name = os.path.basename(aip_dir)
     for fsentry in fsentries:
+        is_directory = fsentry.type.lower() == "directory"
+
         # Do not delete AIP entry
-        if (
-            fsentry.label == os.path.basename(aip_dir)
-            and fsentry.type.lower() == "directory"
-        ):
+        if fsentry.label == aip_dir_name and is_directory:
             continue
 
         # Do not delete objects entry and save it for parenting
-        if fsentry.label == "objects" and fsentry.type.lower() == "directory":
+        if fsentry.label == "objects" and is_directory:
             objects_entry = fsentry
             continue
 
@@ -389,21 +400,19 @@ def update_avalon_manifest(dip_dir, aip_uuid):
             reader = csv.reader(csv_input)
             writer = csv.writer(csv_output, lineterminator="\n")
 
-            all = []
             # Skip row one, Add to row two
             first_row = next(reader)
             row = next(reader)
             row.append("Other Identifier")
             row.append("Other Identifier Label")
-            all.append(first_row)
-            all.append(row)
+            writer.writerow(first_row)
+            writer.writerow(row)
 
+            # Stream the remaining rows instead of keeping the whole manifest
             for row in reader:
                 row.append(aip_uuid)
                 row.append("other")
-                all.append(row)
-
-            writer.writerows(all)
+                writer.writerow(row)
         shutil.move(tmp_csv_path, csv_path)
 
     if not csv_path:
@@ -435,15 +444,14 @@ def get_premis_original_name(premis, namespaces):
 def get_original_relpath(original_name):
     """Get the relative file path from a premis:originalName"""
 
-    path_prefixes = ["%transferDirectory%objects/", "%transferDirectory%data/"]
-    for prefix in path_prefixes:
+    for prefix in ORIGINAL_NAME_PREFIXES:
         if original_name.startswith(prefix):
             return original_name[len(prefix) :]
 
     LOGGER.warning(
         '"%s" has an invalid path prefix, it must be one of ("%s")',
         original_name,
-        '", "'.join(path_prefixes),
+        '", "'.join(ORIGINAL_NAME_PREFIXES),
     )
 
 
@@ -105,8 +105,15 @@ def main(
     # Get only AIPs from the specified location and origin pipeline
     aip_uuids = filter_aips(aips, location_uuid, origin_pipeline_uuid)
 
+    # Load the AIPs recorded in previous runs once, so they can be skipped
+    # without a failed insert and rollback for each of them
+    processed = {row.uuid for row in session.query(models.Aip.uuid)}
+
     # Create DIPs for those AIPs
     for uuid in aip_uuids:
+        if uuid in processed:
+            LOGGER.debug("Skipping AIP (already processed/processing): %s", uuid)
+            continue
         try:
             # To avoid race conditions while checking for an existing AIP
             # and saving it, create the row directly and check for an
@@ -175,6 +182,7 @@ def filter_aips(aips, location_uuid, origin_pipeline_uuid):
     :returns: list of UUIDs from the AIPs in that location
     """
     location = f"/api/v2/location/{location_uuid}/"
+    pipeline = f"/api/v2/pipeline/{origin_pipeline_uuid}/"
     filtered_aips = []
 
     for aip in aips:
@@ -188,7 +196,6 @@ def filter_aips(aips, location_uuid, origin_pipeline_uuid):
             LOGGER.debug("Skipping AIP (different location): %s", aip["uuid"])
             continue
         if origin_pipeline_uuid:
-            pipeline = f"/api/v2/pipeline/{origin_pipeline_uuid}/"
             if "origin_pipeline" not in aip:
                 LOGGER.debug("Skipping AIP (missing pipeline): %s", aip["uuid"])
                 continue
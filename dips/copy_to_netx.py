@@ -6,7 +6,9 @@ Copies a local DIP to NetX, providing a CSV list of each object.
 """
 
 import argparse
+import concurrent.futures
 import csv
+import functools
 import logging.config  # Has to be imported separately
 import os
 import shutil
@@ -59,6 +61,16 @@ def mets_filename_for_dip(dip_path):
     return "METS.%s.xml" % uuid_from_dip_path(dip_path)
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_xpath(path, namespaces):
+    return lxml.etree.XPath(path, namespaces=dict(namespaces))
+
+
+def evaluate_xpath(mets_data, path, namespaces):
+    """Evaluate an XPath expression, compiling it only once per namespaces"""
+    return _compile_xpath(path, tuple(sorted(namespaces.items())))(mets_data)
+
+
 def change_premis_namespace_to_v2(namespaces):
     namespaces_old_premis = namespaces.copy()
     namespaces_old_premis["premis"] = "info:lc/xmlns/premis-v2"
@@ -77,14 +89,14 @@ def parse_component_id_from_mets(mets_data, namespaces):
     """
     path_to_component_id = "/mets:mets/mets:amdSec/mets:techMD/mets:mdWrap/mets:xmlData/premis:object/premis:objectCharacteristics/premis:objectCharacteristicsExtension/fits:fits/fits:toolOutput/fits:tool/exiftool/Componentidentifier"
 
-    identifier = mets_data.xpath(path_to_component_id, namespaces=namespaces)
+    identifier = evaluate_xpath(mets_data, path_to_component_id, namespaces)
 
     if len(identifier):
         return identifier[0].text
 
     # Try again using V2 PREMIS namespace
-    identifier = mets_data.xpath(
-        path_to_component_id, namespaces=change_premis_namespace_to_v2(namespaces)
+    identifier = evaluate_xpath(
+        mets_data, path_to_component_id, change_premis_namespace_to_v2(namespaces)
     )
 
     if len(identifier):
@@ -102,14 +114,14 @@ def parse_object_id_from_mets(mets_data, namespaces):
     """
     path_to_accession_number = "/mets:mets/mets:amdSec/mets:techMD/mets:mdWrap/mets:xmlData/premis:object/premis:objectCharacteristics/premis:objectCharacteristicsExtension/fits:fits/fits:toolOutput/fits:tool/exiftool/MetsMetsHdrAltRecordID"
 
-    accession_number = mets_data.xpath(path_to_accession_number, namespaces=namespaces)
+    accession_number = evaluate_xpath(mets_data, path_to_accession_number, namespaces)
 
     if len(accession_number):
         return accession_number[0].text
 
     # Try again, using V2 PREMIS namespace, to find it as parsed from JSON
-    accession_number = mets_data.xpath(
-        path_to_accession_number, namespaces=change_premis_namespace_to_v2(namespaces)
+    accession_number = evaluate_xpath(
+        mets_data, path_to_accession_number, change_premis_namespace_to_v2(namespaces)
     )
 
     if len(accession_number):
@@ -135,14 +147,24 @@ def write_csv_and_copy_objects(
         objects_path = os.path.join(dip_path, "objects")
         sip_uuid = uuid_from_dip_path(dip_path)
 
-        for object_file in os.listdir(objects_path):
-            # Copy file to NetX directory
-            shutil.copyfile(
-                os.path.join(objects_path, object_file),
-                os.path.join(netx_objects_directory, object_file),
+        object_files = os.listdir(objects_path)
+
+        # Copy files to NetX directory, the copies are independent and I/O
+        # bound so they are run concurrently. Consuming the results re-raises
+        # the first copy error before any CSV row is written.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            list(
+                executor.map(
+                    lambda object_file: shutil.copyfile(
+                        os.path.join(objects_path, object_file),
+                        os.path.join(netx_objects_directory, object_file),
+                    ),
+                    object_files,
+                )
             )
 
-            # Write CSV row
+        # Write CSV rows
+        for object_file in object_files:
             writer.writerow([object_file, object_id, component_id, sip_uuid])
 
 
@@ -169,11 +191,20 @@ def main(
         )
         return 1
 
-    # Copy DIP to the currently processing location path, do not use any of the
-    # existing watched directories as that may trigger other workflows.
+    # Make sure the DIP and its METS file can be read before claiming a
+    # directory for it, otherwise a failed run would leave that directory
+    # behind and block later runs for the same DIP.
+    mets_path = os.path.join(dip_path, mets_filename_for_dip(dip_path))
+    if not os.path.isdir(dip_path) or not os.access(mets_path, os.R_OK):
+        LOGGER.warning("Could not read DIP METS file: %s", mets_path)
+        return 2
+
+    # Claim a directory for the DIP in the working directory, do not use any of
+    # the existing watched directories as that may trigger other workflows.
+    # Objects and METS are read straight from the DIP path, so there is no need
+    # to stage a full copy of the DIP here.
     at_dips_dir = os.path.join(working_directory, "automationToolsCopyToNetX")
-    if not os.path.exists(at_dips_dir):
-        os.makedirs(at_dips_dir)
+    os.makedirs(at_dips_dir, exist_ok=True)
     upload_dir_name = os.path.basename(dip_path)
     upload_dip_dir = os.path.join(at_dips_dir, upload_dir_name)
 
@@ -183,14 +214,13 @@ def main(
         return 1
 
     try:
-        shutil.copytree(dip_path, upload_dip_dir)
-    except (OSError, shutil.Error) as e:
-        LOGGER.warning("Could not move DIP to currently processing path: %s", e)
+        os.mkdir(upload_dip_dir)
+    except OSError as e:
+        LOGGER.warning("Could not create DIP working directory: %s", e)
         return 2
 
     # Attempt to read component and object IDs from metadata if not specified
-    mets_filename = mets_filename_for_dip(dip_path)
-    mets_data = lxml.etree.parse(os.path.join(dip_path, mets_filename))
+    mets_data = lxml.etree.parse(mets_path)
 
     namespaces = {
         "mets": "http://www.loc.gov/METS/",
@@ -212,12 +242,12 @@ def main(
         netx_csv_directory, netx_objects_directory, dip_path, object_id, component_id
     )
 
-    # Finally remove the DIP from the currently processing location
-    LOGGER.info("Removing duplicates.")
+    # Finally release the DIP directory in the working directory
+    LOGGER.info("Removing DIP working directory.")
     try:
         shutil.rmtree(upload_dip_dir)
     except (OSError, shutil.Error) as e:
-        LOGGER.warning("Duplicates removal failed: %s", e)
+        LOGGER.warning("DIP working directory removal failed: %s", e)
 
     # And remove the local copy if requested
     if delete_local_copy:
@@ -54,6 +54,28 @@ def setup_logger(log_file, log_level="INFO"):
     logging.config.dictConfig(CONFIG)
 
 
+def get_dir_size(path):
+    """
+    Calculates the size of a directory tree.
+
+    :param str path: absolute path to a directory
+    :returns: total size in bytes of the files inside the directory, unreadable
+              directories are skipped like in os.walk
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return 0
+    size = 0
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                size += get_dir_size(entry.path)
+            elif entry.is_file():
+                size += entry.stat().st_size
+    return size
+
+
 def main(
     ss_url,
     ss_user,
@@ -71,8 +93,7 @@ def main(
     at_dips_dir = os.path.join(
         shared_directory, "watchedDirectories", "automationToolsDIPs"
     )
-    if not os.path.exists(at_dips_dir):
-        os.makedirs(at_dips_dir)
+    os.makedirs(at_dips_dir, exist_ok=True)
     upload_dir_name = os.path.basename(dip_path)
     upload_dip_dir = os.path.join(at_dips_dir, upload_dir_name)
 
@@ -88,17 +109,13 @@ def main(
         return 2
 
     # Build DIP data for SS request
-    size = 0
-    for dirpath, _, filenames in os.walk(upload_dip_dir):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            size += os.path.getsize(file_path)
+    size = get_dir_size(upload_dip_dir)
     dip_data = {
         "uuid": str(uuid.uuid4()),  # new UUID
-        "origin_pipeline": "/api/v2/pipeline/%s/" % pipeline_uuid,
-        "origin_location": "/api/v2/location/%s/" % cp_location_uuid,
-        "origin_path": "watchedDirectories/automationToolsDIPs/%s/" % upload_dir_name,
-        "current_location": "/api/v2/location/%s/" % ds_location_uuid,
+        "origin_pipeline": f"/api/v2/pipeline/{pipeline_uuid}/",
+        "origin_location": f"/api/v2/location/{cp_location_uuid}/",
+        "origin_path": f"watchedDirectories/automationToolsDIPs/{upload_dir_name}/",
+        "current_location": f"/api/v2/location/{ds_location_uuid}/",
         "current_path": upload_dir_name,
         "package_type": "DIP",
         "aip_subtype": "Archival Information Package",  # same as in AM
@@ -109,7 +126,7 @@ def main(
     }
     # TODO: Move this to amclient.
     LOGGER.info("Storing DIP in Storage Service.")
-    url = "%s/api/v2/file/" % ss_url
+    url = f"{ss_url}/api/v2/file/"
     headers = {"Authorization": f"ApiKey {ss_user}:{ss_api_key}"}
     response = requests.post(url, headers=headers, json=dip_data, timeout=86400)
     result = 0
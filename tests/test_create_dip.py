@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest import mock
 
 import amclient
+import pytest
 import requests
 
 from aips import create_dip
@@ -171,15 +172,14 @@ def test_create_dip_fail_no_aip_dir(tmp_path):
     assert dip_dir is None
 
 
-def test_get_original_relpath_objects_dir():
-    path = "%transferDirectory%objects/folder1/file5.txt"
-
-    assert create_dip.get_original_relpath(path) == "folder1/file5.txt"
-
-
-def test_get_original_relpath_data_dir():
-    path = "%transferDirectory%data/folder1/file5.txt"
-
+@pytest.mark.parametrize(
+    "path",
+    [
+        "%transferDirectory%objects/folder1/file5.txt",
+        "%transferDirectory%data/folder1/file5.txt",
+    ],
+)
+def test_get_original_relpath(path):
     assert create_dip.get_original_relpath(path) == "folder1/file5.txt"
 
 
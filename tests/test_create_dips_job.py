@@ -8,6 +8,7 @@ import requests
 from sqlalchemy import exc
 
 from aips import create_dips_job
+from aips import models
 
 SS_URL = "http://192.168.168.192:8000"
 SS_USER_NAME = "test"
@@ -216,6 +217,32 @@ def test_main_success_no_dip_creation(_get, _request, args):
         assert not os.path.isdir(dip_path)
 
 
+@mock.patch("aips.create_dips_job.create_dip.main")
+@mock.patch(
+    "requests.request",
+    side_effect=[
+        mock.Mock(
+            **{
+                "status_code": 200,
+                "headers": requests.structures.CaseInsensitiveDict(
+                    {"Content-Type": "application/json"}
+                ),
+                "json.return_value": AIPS_JSON,
+            },
+            spec=requests.Response,
+        )
+    ],
+)
+def test_main_skips_aips_in_database(_request, create_dip, args):
+    """Test that AIPs stored in a previous run are not processed again."""
+    session = models.init(args["database_file"])
+    session.add(models.Aip(uuid="3ea465ac-ea0a-4a9c-a057-507e794de332"))
+    session.commit()
+    ret = create_dips_job.main(**args)
+    assert ret is None
+    assert not create_dip.called
+
+
 @mock.patch("aips.create_dips_job.atom_upload.main")
 @mock.patch("aips.create_dips_job.create_dip.main", return_value=1)
 @mock.patch(
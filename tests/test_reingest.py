@@ -1,6 +1,4 @@
 #!/usr/bin/env python
-import os
-
 import pytest
 
 from transfers import reingest
@@ -8,14 +6,11 @@ from transfers import reingestmodel as reingestunit
 
 
 class TestReingestClass:
-    dbpath = "fixtures/reingest_test.db"
-
     @pytest.fixture(autouse=True)
-    def setup_session(self):
-        reingestunit.init(self.dbpath)
+    def setup_session(self, tmp_path):
+        # A database per test keeps tests independent when run in parallel
+        reingestunit.init((tmp_path / "reingest_test.db").as_posix())
         self.session = reingestunit.Session()
-        yield
-        os.remove(self.dbpath)
 
     @pytest.mark.parametrize(
         "aip_uuids, expected",
@@ -51,3 +46,22 @@ class TestReingestClass:
     )
     def test_load_db_iterable(self, aip_uuids, expected):
         assert reingest.load_db(self.session, aip_uuids) == expected
+
+    def test_load_db_skips_duplicates(self):
+        aip_uuids = [
+            "767dcf65-5a28-4ce4-bec2-a2a31e099ad0",
+            "e634c8e7-8105-46d4-a9e2-9ccd202a64c6",
+            "767dcf65-5a28-4ce4-bec2-a2a31e099ad0",
+        ]
+        assert reingest.load_db(self.session, aip_uuids)
+        assert len(reingestunit.get_items_new(self.session)) == 2
+
+    def test_get_items_new_limit(self):
+        aip_uuids = [
+            "35c88dbd-664c-4261-9524-61e095de4009",
+            "43e50d92-486d-4a0c-a451-fc0572feb9f4",
+            "e3bcee81-87c0-4e12-8284-66c23f9619bd",
+        ]
+        assert reingest.load_db(self.session, aip_uuids)
+        assert len(reingestunit.get_items_new(self.session, limit=2)) == 2
+        assert len(reingestunit.get_items_new(self.session)) == 3
@@ -21,7 +21,8 @@ AIP_UUID = "2942ac09-d55e-426b-84d3-0def52739791"
 
 class TestSsUpload(unittest.TestCase):
     @mock.patch("dips.storage_service_upload.os.path.exists", return_value=True)
-    def test_dip_folder_exists(self, mock_path_exists):
+    @mock.patch("dips.storage_service_upload.os.makedirs")
+    def test_dip_folder_exists(self, mock_makedirs, mock_path_exists):
         ret = storage_service_upload.main(
             ss_url=SS_URL,
             ss_user=SS_USER_NAME,
@@ -113,3 +114,15 @@ class TestSsUpload(unittest.TestCase):
             os.path.basename(DIP_PATH),
         )
         mock_rmtree.assert_has_calls([mock.call(upload_dip_path), mock.call(DIP_PATH)])
+
+
+def test_get_dir_size(tmp_path):
+    (tmp_path / "objects" / "folder").mkdir(parents=True)
+    (tmp_path / "METS.xml").write_bytes(b"x" * 10)
+    (tmp_path / "objects" / "folder" / "file").write_bytes(b"x" * 5)
+    assert storage_service_upload.get_dir_size(tmp_path.as_posix()) == 15
+
+
+def test_get_dir_size_missing_dir(tmp_path):
+    missing_dir = tmp_path / "missing"
+    assert storage_service_upload.get_dir_size(missing_dir.as_posix()) == 0
@@ -3,9 +3,14 @@
 # Assumes bags are structured as either bag/data/(content) or bag/data/objects/(content).
 # Enables use of scripts to add metadata to SIP without failing transfer at bag validation.
 import os
+import re
 import shutil
 import sys
 
+# checksum, separator (any run of spaces or tabs, optional binary mode
+# marker) and path of a bag manifest line
+MANIFEST_LINE_RE = re.compile(r"(\S+)([ \t]+\*?)(.*)", re.S)
+
 
 def main(transfer_path):
     transfer_path = os.path.abspath(transfer_path)
@@ -39,11 +44,17 @@ def main(transfer_path):
     with open(os.path.join(transfer_path, "manifest-md5.txt")) as old_file:
         with open(os.path.join(metadata_dir, "checksum.md5"), "w") as new_file:
             for line in old_file:
-                if "data/objects/" in line:
-                    new_line = line.replace("data/objects/", "../objects/")
-                else:
-                    new_line = line.replace("data/", "../objects/")
-                new_file.write(new_line)
+                match = MANIFEST_LINE_RE.match(line)
+                if not match:
+                    # keep lines that can't be parsed as they are
+                    new_file.write(line)
+                    continue
+                checksum, separator, path = match.groups()
+                for prefix in ("data/objects/", "data/"):
+                    if path.startswith(prefix):
+                        path = "../objects/" + path[len(prefix) :]
+                        break
+                new_file.write(f"{checksum}{separator}{path}")
 
     # move bag files to submissionDocumentation
     for bagfile in (
@@ -17,8 +17,7 @@ def main(transfer_path):
     print("Identifier: ", dc_id, end="")
     metadata = [["parts", "dc.identifier"], ["objects", dc_id]]
     metadata_path = os.path.join(transfer_path, "metadata")
-    if not os.path.exists(metadata_path):
-        os.makedirs(metadata_path)
+    os.makedirs(metadata_path, exist_ok=True)
     metadata_path = os.path.join(metadata_path, "metadata.csv")
     with open(metadata_path, "w") as f:
         csvwriter = csv.writer(f)
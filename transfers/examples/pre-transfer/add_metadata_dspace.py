@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 import csv
+import itertools
 import os
 import re
 import sys
 
+DSPACE_EXPORT_RE = re.compile(r"[\w]+@([\d]+)-([\d]+)\.zip$")
+
 
 def main(transfer_path):
     """
@@ -19,12 +22,13 @@ def main(transfer_path):
     ITEM@2429-10029.zip -> 2429/10029
     SITE@2429-0.zip -> 2429/0
     """
-    files = os.listdir(transfer_path)
+    # Only two entries are needed to tell whether there is exactly one
+    with os.scandir(transfer_path) as entries:
+        files = [entry.name for entry in itertools.islice(entries, 2)]
     if len(files) != 1:
         return 2
     basename = os.path.basename(files[0])
-    regex = r"[\w]+@([\d]+)-([\d]+)\.zip$"
-    match = re.search(regex, basename)
+    match = DSPACE_EXPORT_RE.search(basename)
     if not match:
         return 1
 
@@ -33,8 +37,7 @@ def main(transfer_path):
     header = ["parts", "dc.identifier"]
     data = ["objects", dc_id]
     metadata_path = os.path.join(transfer_path, "metadata")
-    if not os.path.exists(metadata_path):
-        os.makedirs(metadata_path)
+    os.makedirs(metadata_path, exist_ok=True)
     metadata_path = os.path.join(metadata_path, "metadata.csv")
     with open(metadata_path, "w") as f:
         w = csv.writer(f)
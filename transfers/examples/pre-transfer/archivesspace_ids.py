@@ -21,14 +21,16 @@ def main(transfer_path):
     as_ids = []
 
     for dirpath, _, filenames in os.walk(transfer_path):
+        # os.walk yields paths under transfer_path, so strip it once per directory
+        relative_dirpath = os.path.join(dirpath, "")[len(transfer_path) :]
         for filename in filenames:
             identifier = os.path.splitext(filename)[0]
-            relative_path = os.path.join(dirpath, filename).replace(transfer_path, "")
+            relative_path = relative_dirpath + filename
             if not identifier or not relative_path:
                 continue
             as_ids.append([relative_path, identifier])
 
-    print(as_ids)
+    print("Writing", len(as_ids), "identifiers to", archivesspaceids_path)
     # Write out CSV
     try:
         os.mkdir(os.path.join(data_path, "metadata"))
@@ -28,15 +28,10 @@ class SIPMetadata:
         self.index_csv()
 
     def index_csv(self):
-        self.index = {}
-        with open(self.csv_file) as csvf:
+        with open(self.csv_file, newline="") as csvf:
             csvr = csv.reader(csvf, delimiter=self.csv_delimiter)
-            for i, row in enumerate(csvr):
-                if i == 0:
-                    self.headers = row
-                    continue
-                path = row[0]
-                self.index[path] = row
+            self.headers = next(csvr, [])
+            self.index = {row[0]: row for row in csvr if row}
 
     def get_object_metadata(self, path):
         return (self.headers, self.index[path])
@@ -231,10 +231,13 @@ def load_db(session, aiplist):
     if isinstance(aiplist, ((str,), str)):
         return False
     try:
+        # Commit once for the whole list instead of once per AIP
         for aip in aiplist:
-            reingestunit.insert_aip_row_for_reingest(session, aip)
+            reingestunit.insert_aip_row_for_reingest(session, aip, commit=False)
+        session.commit()
         return True
     except TypeError:
+        session.rollback()
         LOGGER.error("AIP list to load is not properly formed.")
         return False
 
@@ -284,11 +287,14 @@ def update_reingest(session, amclient):
         amclient.package_uuid = aip_uuid
         transfer_status = get_status(amclient.get_transfer_status())
         ingest_status = get_status(amclient.get_ingest_status())
-        aip_status = get_status(amclient.get_package_details())
         if transfer_status == "COMPLETE" and ingest_status == "PROCESSING":
             LOGGER.info("AIP %s processing is now in ingest", aip_uuid)
-        elif ingest_status == "COMPLETE" and aip_status == "UPLOADED":
-            reingestunit.set_status_complete(session, aip.aip_uuid)
+        elif ingest_status == "COMPLETE":
+            # Only ask the Storage Service about the package once ingest is
+            # done, until then its status cannot tell us anything new.
+            aip_status = get_status(amclient.get_package_details())
+            if aip_status == "UPLOADED":
+                reingestunit.set_status_complete(session, aip.aip_uuid)
 
 
 def start_reingest(
@@ -308,17 +314,19 @@ def start_reingest(
     useful when automating the reingest process where this script is called
     repeatedly via a cronjob.
     """
-    new_aips = reingestunit.get_items_new(session)
     in_progress = reingestunit.get_items_in_progress(session)
+    pool = throttle - len(in_progress)
+    # Only load the new AIPs that can be started in this run, but at least
+    # one to know whether there is anything left to do
+    new_aips = reingestunit.get_items_new(session, limit=max(pool, 1))
     if not new_aips and not in_progress:
         # Return early, reingest complete
         return True
-    pool = throttle - len(in_progress)
     if pool < 1:
         LOGGER.info("Pool is less than one, exiting, until next run")
         return False
-    for index in range(min(pool, len(new_aips))):
-        aip = new_aips[index].aip_uuid
+    for new_aip in new_aips:
+        aip = new_aip.aip_uuid
         error, message = reingest_full_and_approve(
             amclient,
             pipeline_uuid,
@@ -460,7 +468,7 @@ def main():
     # the Storage Service a little more for matching AIPs.
     if args.listcompressedaips:
         aips = amclient.get_all_compressed_aips()
-        LOGGER.info("%s Compressed AIPs in the Storage Service", len(aips.keys()))
+        LOGGER.info("%s Compressed AIPs in the Storage Service", len(aips))
         LOGGER.debug("Compressed AIPs list: %s", aips.keys())
         sys.exit()
 
@@ -468,18 +476,18 @@ def main():
         comparelist = loadfromlist(args.compareaiplist)
         if comparelist:
             aips = amclient.get_all_compressed_aips()
-            list1 = comparelist  # user-list
-            list2 = aips.keys()
-            if set(list1) == set(list2):
+            set1 = set(comparelist)  # user-list
+            set2 = set(aips)
+            if set1 == set2:
                 LOGGER.info(
                     "Both lists of compressed AIPs are identical. "
                     "Recommendation is to proceed with reingest"
                 )
             else:
-                print("Difference in user set: %s", list(set(list1) - set(list2)))
+                print("Difference in user set: %s", list(set1 - set2))
                 print(
                     "Difference in Storage Service set: %s",
-                    list(set(list2) - set(list1)),
+                    list(set2 - set1),
                 )
         sys.exit()
 
@@ -507,7 +515,7 @@ def main():
     elif not load_items and args.processfromstorage:
         LOGGER.info("Reingesting from Storage Service list of AIPs")
         aips = amclient.get_all_compressed_aips()
-        if not load_db(session, list(aips.keys())):
+        if not load_db(session, aips):
             sys.exit(ERR_PROCESSING)
 
     # Check for existing transfers in the pipeline matching our AIPs and update
@@ -89,11 +89,14 @@ def init(databasefile):
     BASE.metadata.create_all(engine)
 
 
-def get_items(session, status=None):
-    """Return everything from the database."""
-    if status is None:
-        return session.query(ReingestUnit).all()
-    return session.query(ReingestUnit).filter_by(status=status).all()
+def get_items(session, status=None, limit=None):
+    """Return everything from the database, or at most limit items."""
+    query = session.query(ReingestUnit)
+    if status is not None:
+        query = query.filter_by(status=status)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
 
 
 def get_item_by_aip_uuid(session, aip_uuid):
@@ -101,14 +104,18 @@ def get_item_by_aip_uuid(session, aip_uuid):
     return session.query(ReingestUnit).filter_by(aip_uuid=aip_uuid).scalar()
 
 
-def insert(session, item):
+def insert(session, item, commit=True):
     """Insert an item into the database and update if the item already exists
     and its status is being modified.
+
+    Callers inserting many items can pass commit=False and commit the session
+    once at the end.
     """
     exists = get_item_by_aip_uuid(session, item.aip_uuid)
     if exists is None:
         session.add(item)
-        session.commit()
+        if commit:
+            session.commit()
     elif exists.status != item.status:
         LOGGER.info(
             "Item %s exists in database with status %s:", exists.aip_uuid, exists.status
@@ -140,9 +147,13 @@ def _set_status(session, status_enum, aip_uuid, transfer_uuid=None, message=None
     return item
 
 
-def insert_aip_row_for_reingest(session, aip_uuid):
+def insert_aip_row_for_reingest(session, aip_uuid, commit=True):
     """Create a new reingest unit and set item status to new."""
-    insert(session, ReingestUnit(aip_uuid=aip_uuid, status=StatusEnum.STATUS_NEW))
+    insert(
+        session,
+        ReingestUnit(aip_uuid=aip_uuid, status=StatusEnum.STATUS_NEW),
+        commit=commit,
+    )
 
 
 def set_status_in_progress(session, aip_uuid, transfer_uuid):
@@ -169,9 +180,9 @@ def set_status_error(session, aip_uuid, message):
     _set_status(session, StatusEnum.STATUS_ERROR, aip_uuid=aip_uuid, message=message)
 
 
-def get_items_new(session):
+def get_items_new(session, limit=None):
     """Get items in the database that have status new."""
-    return get_items(session, StatusEnum.STATUS_NEW)
+    return get_items(session, StatusEnum.STATUS_NEW, limit=limit)
 
 
 def get_items_in_progress(session):
@@ -9,6 +9,7 @@ import ast
 import atexit
 import base64
 import configparser
+import functools
 import logging
 import os
 import shutil
@@ -60,12 +61,19 @@ def create_db_session(config_file):
     return models.Session()
 
 
+@functools.lru_cache(maxsize=None)
+def _read_config(config_file):
+    """Parse the configuration file once per process."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return config
+
+
 def get_setting(config_file, setting, default=None):
     """Get an option value from the configuration file."""
-    config = configparser.ConfigParser()
+    config = _read_config(config_file)
     section = "transfers"
     try:
-        config.read(config_file)
         cfg = config.get(section, setting)
         LOGGER.info("Configuration values read for %s: %s", setting, cfg)
         return cfg
@@ -102,8 +110,7 @@ def get_status(
     params = {"username": am_user, "api_key": am_api_key}
     unit_info = utils._call_url_json(url, params)
     if isinstance(unit_info, int):
-        if errors.error_lookup(unit_info) is not None:
-            return errors.error_lookup(unit_info)
+        return errors.error_lookup(unit_info)
     # If complete, hide in dashboard
     if hide_on_complete and unit_info and unit_info.get("status") == "COMPLETE":
         LOGGER.info("Hiding %s %s in dashboard", unit_type, unit_uuid)
@@ -134,8 +141,7 @@ def get_status(
         url = "{}/api/ingest/status/{}/".format(am_url, unit_info.get("sip_uuid"))
         unit_info = utils._call_url_json(url, params)
         if isinstance(unit_info, int):
-            if errors.error_lookup(unit_info) is not None:
-                return errors.error_lookup(unit_info)
+            return errors.error_lookup(unit_info)
         # If complete, hide in dashboard
         if hide_on_complete and unit_info and unit_info.get("status") == "COMPLETE":
             LOGGER.info("Hiding SIP %s in dashboard", unit.uuid)
@@ -242,7 +248,7 @@ def run_scripts(directory, config_file, *args):
         return
     script_args = list(args)
     LOGGER.debug("script_args: %s", script_args)
-    script_extensions = get_setting(config_file, "scriptextensions", "").split(":")
+    script_extensions = set(get_setting(config_file, "scriptextensions", "").split(":"))
     LOGGER.debug("script_extensions: %s", script_extensions)
     for script in sorted(os.listdir(directory)):
         LOGGER.debug("Script: %s", script)
@@ -305,17 +311,16 @@ def get_next_transfer(
     :returns:                Path relative to TS Location of the new transfer.
     """
     # Get sorted list from source directory.
-    url = ss_url + "/api/v2/location/" + ts_location_uuid + "/browse/"
+    url = f"{ss_url}/api/v2/location/{ts_location_uuid}/browse/"
     params = {"username": ss_user, "api_key": ss_api_key}
     if path_prefix:
         params["path"] = base64.b64encode(path_prefix)
     browse_info = utils._call_url_json(url, params)
     if isinstance(browse_info, int):
-        if errors.error_lookup(browse_info) is not None:
-            LOGGER.error(
-                "Error when browsing location: %s", errors.error_lookup(browse_info)
-            )
-            return None
+        LOGGER.error(
+            "Error when browsing location: %s", errors.error_lookup(browse_info)
+        )
+        return None
     if browse_info is None:
         return None
     if see_files:
@@ -333,12 +338,11 @@ def get_next_transfer(
         entries = set(entries) - processed
         LOGGER.debug("New transfer candidates: %s", entries)
         LOGGER.info("Unprocessed entries to choose from: %s", len(entries))
-        # Sort, take the first
-        entries = sorted(entries)
+        # Take the first in sorted order, without sorting all of them
         if not entries:
             LOGGER.info("All potential transfers in %s have been created.", path_prefix)
             return None
-        target = entries[0]
+        target = min(entries)
         return target
     else:  # if depth > 1
         # Recurse on each directory
@@ -529,28 +533,30 @@ def approve_transfer(dirname, url, am_api_key, am_user):
     if not waiting_transfers:
         LOGGER.warning("There are no waiting transfers.")
         return None
-    res = list(
-        filter(
-            lambda waiting: fsencode(waiting["directory"]) == fsencode(dirname),
-            waiting_transfers,
-        )
+    encoded_dirname = fsencode(dirname)
+    res = next(
+        (
+            waiting
+            for waiting in waiting_transfers
+            if fsencode(waiting["directory"]) == encoded_dirname
+        ),
+        None,
     )
-    if not res:
+    if res is None:
         LOGGER.warning(
             "Requested directory %s not found in the waiting transfers list", dirname
         )
         return None
-    LOGGER.info("Found waiting transfer: %s", res[0]["directory"])
+    LOGGER.info("Found waiting transfer: %s", res["directory"])
     # We can reuse the existing AM Client but we didn't know all the kwargs
     # at the outset so we need to set its attributes here.
-    am.transfer_type = res[0]["type"]
+    am.transfer_type = res["type"]
     am.transfer_directory = dirname
     # Approve the transfer and return the UUID of the transfer approved.
     approved = am.approve_transfer()
     if isinstance(approved, int):
-        if errors.error_lookup(approved) is not None:
-            LOGGER.error("Error approving transfer: %s", errors.error_lookup(approved))
-            return None
+        LOGGER.error("Error approving transfer: %s", errors.error_lookup(approved))
+        return None
     # Get will return None, or the UUID.
     return approved.get("uuid")
 
@@ -33,9 +33,12 @@ def _call_url_json(url, params=None, method=METHOD_GET, headers=None, assume_jso
             response = requests.request(method, url=url, params=params, headers=headers)
         else:
             response = requests.request(method, url=url, data=params, headers=headers)
-        LOGGER.debug("Response: %s", response)
-        LOGGER.debug("type(response.text): %s ", type(response.text))
-        LOGGER.debug("Response content-type: %s", response.headers["content-type"])
+        # Reading response.text decodes the whole body, only do it when the
+        # output is going to be logged
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Response: %s", response)
+            LOGGER.debug("type(response.text): %s ", type(response.text))
+            LOGGER.debug("Response content-type: %s", response.headers["content-type"])
     except (
         urllib3.exceptions.NewConnectionError,
         requests.exceptions.ConnectionError,